@@ -1,6 +1,7 @@
 """配置管理模块"""
 
 import configparser
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional
 import os
@@ -14,6 +15,34 @@ class ConfigManager:
         self.config = configparser.ConfigParser(interpolation=None)  # 禁用插值
         self._load_config()
     
+    @classmethod
+    def from_dict(cls, config_dict: Dict[str, Dict[str, Any]],
+                  config_file: str = "config.ini") -> "ConfigManager":
+        """从已解析的配置dict直接构造，不读写磁盘
+
+        跳过INI文本解析，适合测试或已持有配置数据的调用方。
+        config_file仅作为后续save_config的目标路径记录。
+        """
+        instance = cls.__new__(cls)
+        instance.config_file = Path(config_file)
+        instance.config = configparser.ConfigParser(interpolation=None)
+        instance.config.read_dict(config_dict)
+        return instance
+
+    @classmethod
+    def from_string(cls, ini_text: str,
+                    config_file: str = "config.ini") -> "ConfigManager":
+        """从INI文本直接构造，不读写磁盘
+
+        适合测试或配置内容来自网络/内存的调用方。
+        config_file仅作为后续save_config的目标路径记录。
+        """
+        instance = cls.__new__(cls)
+        instance.config_file = Path(config_file)
+        instance.config = configparser.ConfigParser(interpolation=None)
+        instance.config.read_string(ini_text)
+        return instance
+
     def _load_config(self) -> None:
         """加载配置文件"""
         if self.config_file.exists():
@@ -35,7 +64,7 @@ class ConfigManager:
         
         # 数据导入设置
         self.config['import_settings'] = {
-            'batch_size': '1000',               # 批量插入的记录数，建议1000-5000
+            'batch_size': '10000',              # 批量插入的记录数，大批量可显著减少DB往返
             'max_retries': '3',                 # 失败重试次数
             'timeout': '30',                    # 数据库连接超时时间（秒）
             'auto_commit': 'true',              # 是否自动提交事务
@@ -122,8 +151,8 @@ class ConfigManager:
             f.write("# ===========================================\n")
             f.write("[import_settings]\n")
             f.write("# 批量插入的记录数\n")
-            f.write("# 建议范围：500-5000，过大可能导致内存问题，过小影响性能\n")
-            f.write("# 默认值：1000\n")
+            f.write("# 建议范围：1000-10000，过大可能导致内存问题，过小影响性能\n")
+            f.write("# 默认值：10000\n")
             f.write(f"batch_size = {self.config['import_settings']['batch_size']}\n")
             f.write("\n")
             f.write("# 操作失败时的最大重试次数\n")
@@ -281,7 +310,7 @@ class ConfigManager:
         settings = dict(self.config['import_settings'])
         
         # 类型转换
-        settings['batch_size'] = int(settings.get('batch_size', 1000))
+        settings['batch_size'] = int(settings.get('batch_size', 10000))
         settings['max_retries'] = int(settings.get('max_retries', 3))
         settings['timeout'] = int(settings.get('timeout', 30))
         settings['auto_commit'] = settings.get('auto_commit', 'true').lower() == 'true'
@@ -381,4 +410,26 @@ class ConfigManager:
         config_dict = {}
         for section in self.config.sections():
             config_dict[section] = dict(self.config[section])
-        return str(config_dict)
\ No newline at end of file
+        return str(config_dict)
+
+
+@lru_cache(maxsize=8)
+def _cached_config_manager(config_file: str, mtime: float) -> ConfigManager:
+    """按(路径, 修改时间)缓存的ConfigManager构造"""
+    return ConfigManager(config_file)
+
+
+def get_config_manager(config_file: str = "config.ini") -> ConfigManager:
+    """获取ConfigManager实例
+
+    同一配置文件在未修改的情况下只解析一次，后续调用复用缓存的实例，
+    避免各CLI子命令和内部组件重复读取INI文件。
+    文件被修改（mtime变化）后会重新加载。
+    """
+    try:
+        mtime = os.path.getmtime(config_file)
+    except OSError:
+        # 文件不存在时ConfigManager会创建默认配置，不走缓存
+        return ConfigManager(config_file)
+
+    return _cached_config_manager(str(config_file), mtime)
\ No newline at end of file
@@ -1,29 +1,60 @@
 """表结构创建器"""
 
+import copy
+import hashlib
 import pandas as pd
+import pickle
+from contextlib import suppress
+from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple
 import logging
 import re
 from datetime import datetime
 from ..config.config_manager import ConfigManager
 
+# 推断结果的磁盘缓存目录：同一份数据跨进程（scan→preview→import）复用
+_CACHE_DIR = Path.home() / '.cache' / 'oracle_import_tool'
+
+# 缓存结构版本：推断逻辑或缓存格式变化时递增，使旧缓存自动失效
+_CACHE_SCHEMA_VERSION = '2'
+
 
 class TableCreator:
     """表结构推断和创建"""
-    
+
     def __init__(self, config_manager: ConfigManager):
         self.config_manager = config_manager
         self.data_types_config = config_manager.get_data_types_config()
         self.logger = logging.getLogger(__name__)
-    
+        # 内存层结构缓存：同一进程内重复推断直接命中
+        self._structure_cache: Dict[str, Dict[str, Any]] = {}
+
     def infer_table_structure(self, df: pd.DataFrame, table_name: str) -> Dict[str, Any]:
-        """基于DataFrame推断表结构"""
+        """基于DataFrame推断表结构
+
+        推断是纯函数（相同数据必得相同结构），结果按内容指纹缓存：
+        先查进程内字典，再查磁盘缓存，未命中才逐列分析。
+        """
+        if df.empty:
+            raise ValueError(f"数据为空，无法推断表结构: {table_name}")
+
+        cache_key = self._dataframe_fingerprint(df, table_name)
+
+        cached = self._structure_cache.get(cache_key)
+        if cached is None:
+            cached = self._load_cached_structure(cache_key)
+            if cached is not None:
+                self._structure_cache[cache_key] = cached
+        if cached is not None:
+            # 返回副本，调用方可安全修改
+            return copy.deepcopy(cached)
+
         columns = []
-        
-        for column_name in df.columns:
-            column_info = self._analyze_column(df[column_name], column_name)
+
+        for index, column_name in enumerate(df.columns, start=1):
+            column_info = self._analyze_column(df[column_name], column_name, index)
             columns.append(column_info)
-        
+
         table_info = {
             'table_name': table_name.upper(),
             'columns': columns,
@@ -31,16 +62,64 @@ class TableCreator:
             'indexes': [],
             'constraints': []
         }
-        
+
         # 添加审计字段
         table_info = self.add_audit_columns(table_info)
-        
+
+        self._structure_cache[cache_key] = copy.deepcopy(table_info)
+        self._save_cached_structure(cache_key, table_info)
+
         return table_info
+
+    def _dataframe_fingerprint(self, df: pd.DataFrame, table_name: str) -> str:
+        """计算DataFrame的内容指纹（版本+相关配置+列名+类型+行哈希）"""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(_CACHE_SCHEMA_VERSION.encode('utf-8'))
+        # 推断结果依赖这些配置项，用户改配置后旧缓存必须失效
+        config_part = '|'.join(
+            str(self.data_types_config.get(key))
+            for key in ('string_max_length', 'number_precision', 'number_scale')
+        )
+        digest.update(config_part.encode('utf-8'))
+        digest.update(table_name.upper().encode('utf-8'))
+        digest.update('|'.join(str(c) for c in df.columns).encode('utf-8'))
+        digest.update('|'.join(str(t) for t in df.dtypes).encode('utf-8'))
+        # hash_pandas_object为每行产出uint64，C级实现，O(n)但常数很小
+        digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+        return digest.hexdigest()
+
+    def _load_cached_structure(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """从磁盘缓存加载推断结果，任何IO/反序列化问题都视为未命中"""
+        cache_file = _CACHE_DIR / f"{cache_key}.pkl"
+        with suppress(OSError, pickle.PickleError, EOFError):
+            if cache_file.exists():
+                with open(cache_file, 'rb') as f:
+                    return pickle.load(f)
+        return None
+
+    def _save_cached_structure(self, cache_key: str, table_info: Dict[str, Any]) -> None:
+        """把推断结果写入磁盘缓存，写失败不影响主流程"""
+        with suppress(OSError, pickle.PickleError):
+            _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with open(_CACHE_DIR / f"{cache_key}.pkl", 'wb') as f:
+                pickle.dump(table_info, f, protocol=pickle.HIGHEST_PROTOCOL)
     
-    def _analyze_column(self, series: pd.Series, column_name: str) -> Dict[str, Any]:
+    @staticmethod
+    def _normalize_column_name(column_name: str, index: int = 1) -> str:
+        """把列名规范化为Oracle兼容的标识符
+
+        特殊字符替换为下划线并转为大写；清理后没有可用字符的列名
+        （如纯中文列名）退化为COL_{序号}；超长名称截断到30字符。
+        """
+        normalized = re.sub(r'[^A-Za-z0-9_]+', '_', str(column_name)).strip('_').upper()
+        if not normalized:
+            return f"COL_{index}"
+        return normalized[:30]
+
+    def _analyze_column(self, series: pd.Series, column_name: str, index: int = 1) -> Dict[str, Any]:
         """分析单个列的数据类型和属性"""
         column_info = {
-            'name': column_name.upper(),
+            'name': self._normalize_column_name(column_name, index),
             'nullable': series.isnull().any(),
             'default_value': None
         }
@@ -141,13 +220,8 @@ class TableCreator:
             return datetime_result
         
         # 计算最大长度
-        max_length = 0
-        
-        for value in series.dropna():
-            if pd.notna(value):
-                length = len(str(value))
-                max_length = max(max_length, length)
-        
+        max_length = self._get_max_string_length(series)
+
         # 确定VARCHAR2长度，至少50，最大4000
         if max_length == 0:
             length = 100
@@ -166,6 +240,18 @@ class TableCreator:
             'scale': None
         }
     
+    @staticmethod
+    def _get_max_string_length(series: pd.Series) -> int:
+        """计算列中字符串值的最大长度
+
+        整列一次str.len()向量化求长代替逐元素Python循环，
+        全空列返回0。
+        """
+        non_null = series.dropna()
+        if non_null.empty:
+            return 0
+        return int(non_null.astype(str).str.len().max())
+
     def _check_if_datetime_string(self, series: pd.Series) -> Optional[Dict[str, Any]]:
         """检查字符串列是否包含日期时间数据"""
         from ..utils.datetime_parser import datetime_parser
@@ -441,6 +527,9 @@ class TableCreator:
         table_name = table_info.get('table_name', '')
         if not table_name:
             errors.append("表名不能为空")
+        elif not table_name[0].isalpha():
+            # Oracle标识符必须以字母开头
+            errors.append(f"表名必须以字母开头: {table_name}")
         elif len(table_name) > 30:
             errors.append(f"表名过长（{len(table_name)} > 30）: {table_name}")
         
@@ -3,10 +3,47 @@
 import pandas as pd
 from pathlib import Path
 from typing import Optional, Dict, Any, List
+from functools import lru_cache
 import logging
 import chardet
 import re
-from ..utils.header_detector import HeaderDetector
+from ..utils.header_detector import get_header_detector
+
+# pyarrow为可选加速依赖：存在时CSV解析可走多线程C++引擎
+try:
+    import pyarrow  # noqa: F401
+    _HAS_PYARROW = True
+except ImportError:
+    _HAS_PYARROW = False
+
+
+def _read_csv(*args: Any, **kwargs: Any) -> pd.DataFrame:
+    """pd.read_csv的薄封装
+
+    pyarrow可用时优先用其多线程C++解析器；参数组合不受支持
+    或解析失败时回退pandas默认引擎，行为与直接调用一致。
+    """
+    if _HAS_PYARROW:
+        try:
+            return pd.read_csv(*args, engine='pyarrow', **kwargs)
+        except Exception:
+            pass
+    return pd.read_csv(*args, **kwargs)
+
+
+# 表名规范化：常见分隔符走单遍C级translate，其余非法字符由预编译正则兜底
+_TABLE_NAME_TR = str.maketrans({c: '_' for c in '-. ()[]{},;!@#$%&+='})
+_NON_WORD_RE = re.compile(r'[^\w]')
+_MULTI_UNDERSCORE_RE = re.compile(r'_+')
+
+
+def _to_table_name(stem: str) -> str:
+    """把文件名主干转换为Oracle风格的表名（大写、下划线分隔）"""
+    name = stem.translate(_TABLE_NAME_TR)
+    if _NON_WORD_RE.search(name):
+        name = _NON_WORD_RE.sub('_', name)
+    name = _MULTI_UNDERSCORE_RE.sub('_', name)
+    return name.strip('_').upper()
 
 
 class FileReader:
@@ -17,13 +54,13 @@ class FileReader:
         self.remove_date_suffix = remove_date_suffix
         self.logger = logging.getLogger(__name__)
         
-        # 初始化表头检测器
+        # 初始化表头检测器（按配置缓存，整个导入批次共用一个实例）
         if header_config is None:
-            header_config = {
-                'header_keywords': '',
-                'header_detection_mode': 'auto'
-            }
-        self.header_detector = HeaderDetector(header_config)
+            header_config = {}
+        self.header_detector = get_header_detector(
+            header_config.get('header_keywords', ''),
+            header_config.get('header_detection_mode', 'auto')
+        )
     
     def read_file(self, file_path: str, ddl_columns: Optional[List[str]] = None, ddl_info: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
         """根据文件扩展名选择相应的读取方法
@@ -47,6 +84,91 @@ class FileReader:
         else:
             raise ValueError(f"不支持的文件格式: {extension}")
     
+    def read_buffer(self, buffer: Any, extension: str) -> pd.DataFrame:
+        """从内存缓冲读取数据，跳过磁盘和编码检测
+
+        Args:
+            buffer: 文件内容缓冲（CSV用StringIO，Excel用BytesIO）
+            extension: 文件扩展名（如'.csv'、'.xlsx'），用于选择解析器
+        """
+        extension = extension.lower()
+
+        if extension in ['.xls', '.xlsx']:
+            df = pd.read_excel(buffer)
+        elif extension == '.csv':
+            df = _read_csv(buffer, na_values=['', 'NaN', 'NULL', 'null', 'None'])
+        else:
+            raise ValueError(f"不支持的文件格式: {extension}")
+
+        return self._clean_dataframe(df)
+
+    def iter_chunks(self, file_path: str, chunksize: int = 10000,
+                    ddl_columns: Optional[List[str]] = None,
+                    ddl_info: Optional[Dict[str, Any]] = None):
+        """分块产出文件数据（生成器），用于流式导入
+
+        常规逗号分隔CSV走pandas的chunksize流式解析，内存占用与块
+        大小成正比；表头检测不通过或流式解析失败时回退为read_file
+        整读单块，产出内容与一次性读取一致。
+        """
+        path = Path(file_path)
+        if not path.exists():
+            raise FileNotFoundError(f"文件不存在: {file_path}")
+
+        stream = None
+        if path.suffix.lower() == '.csv':
+            stream = self._try_open_csv_stream(file_path, chunksize, ddl_info)
+
+        if stream is None:
+            yield self.read_file(file_path, ddl_columns, ddl_info)
+            return
+
+        first_chunk, reader = stream
+        skip_optimization = bool(ddl_info)
+        yield self._clean_dataframe(first_chunk, skip_dtype_optimization=skip_optimization)
+        for chunk in reader:
+            yield self._clean_dataframe(chunk, skip_dtype_optimization=skip_optimization)
+
+    def _try_open_csv_stream(self, file_path: str, chunksize: int,
+                             ddl_info: Optional[Dict[str, Any]]):
+        """尝试为CSV打开流式读取器
+
+        返回(首块, 后续块迭代器)；文件需要分隔符探测、无表头处理
+        等完整读取逻辑时返回None，由调用方回退read_file。
+        """
+        try:
+            encoding = self._detect_encoding(file_path)
+
+            read_params: Dict[str, Any] = {
+                'encoding': encoding,
+                'na_values': ['', 'NaN', 'NULL', 'null', 'None'],
+                'chunksize': chunksize
+            }
+            dtype_dict = self._build_dtype_dict_from_ddl(ddl_info) if ddl_info else None
+            if dtype_dict:
+                read_params['dtype'] = dtype_dict
+
+            reader = pd.read_csv(file_path, **read_params)
+        except Exception:
+            return None
+
+        # reader一旦建立就持有文件句柄，所有回退路径必须显式关闭，
+        # 否则句柄等到GC才释放，Windows下会阻止文件的删除/移动
+        try:
+            first_chunk = next(reader)
+
+            if len(first_chunk.columns) <= 1 and len(first_chunk) == 0:
+                reader.close()
+                return None
+            if not self.header_detector.detect_header(first_chunk.columns.tolist()):
+                reader.close()
+                return None
+
+            return first_chunk, reader
+        except Exception:
+            reader.close()
+            return None
+
     def read_excel(self, file_path: str, ddl_columns: Optional[List[str]] = None, ddl_info: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
         """读取Excel文件 (XLS/XLSX)"""
         try:
@@ -109,7 +231,7 @@ class FileReader:
                     if dtype_dict:
                         read_params['dtype'] = dtype_dict
                     
-                    df_with_header = pd.read_csv(file_path, **read_params)
+                    df_with_header = _read_csv(file_path, **read_params)
                     
                     # 检查是否成功解析且有合理的表头
                     if (len(df_with_header.columns) > 1 or (len(df_with_header.columns) == 1 and len(df_with_header) > 0)):
@@ -127,7 +249,7 @@ class FileReader:
                 self.logger.info("未检测到表头，尝试使用DDL列定义进行无表头读取")
                 for sep in separators:
                     try:
-                        df_no_header = pd.read_csv(
+                        df_no_header = _read_csv(
                             file_path,
                             encoding=encoding,
                             sep=sep,
@@ -148,7 +270,7 @@ class FileReader:
             if df is None:
                 for sep in separators:
                     try:
-                        df = pd.read_csv(
+                        df = _read_csv(
                             file_path,
                             encoding=encoding,
                             sep=sep,
@@ -316,17 +438,20 @@ class FileReader:
     
     def get_table_name_from_filename(self, file_path: str) -> str:
         """从文件名提取表名"""
+        return self._table_name_from_path(file_path, self.remove_date_suffix)
+
+    @classmethod
+    def _table_name_from_path(cls, file_path: str, remove_date_suffix: bool) -> str:
+        """从文件路径推断Oracle表名（无实例状态，供缓存路径复用）"""
         path = Path(file_path)
         table_name = path.stem
-        
+
         # 移除常见的日期后缀（如果启用）
-        if self.remove_date_suffix:
-            table_name = self._remove_date_suffix(table_name)
-        
+        if remove_date_suffix:
+            table_name = cls._remove_date_suffix(table_name)
+
         # 清理表名
-        table_name = re.sub(r'[^\w]', '_', table_name)
-        table_name = re.sub(r'_+', '_', table_name)
-        table_name = table_name.strip('_').upper()
+        table_name = _to_table_name(table_name)
         
         # 确保表名符合Oracle命名规范
         if not table_name or not table_name[0].isalpha():
@@ -338,7 +463,8 @@ class FileReader:
         
         return table_name
     
-    def _remove_date_suffix(self, filename: str) -> str:
+    @staticmethod
+    def _remove_date_suffix(filename: str) -> str:
         """移除文件名中的日期后缀
         
         支持的日期格式：
@@ -368,62 +494,136 @@ class FileReader:
         
         return filename
     
-    def scan_directory(self, directory: str, extensions: Optional[List[str]] = None) -> List[Dict[str, Any]]:
-        """扫描目录中的数据文件"""
+    def iter_directory(self, directory: str, extensions: Optional[List[str]] = None):
+        """逐个产出目录中数据文件的信息（生成器）
+
+        与scan_directory不同，不在内存中累积完整列表，也不保证顺序，
+        适合只需要流式处理（如CLI扫描显示）的场景。
+        """
         if extensions is None:
             extensions = ['xls', 'xlsx', 'csv']
-        
+
         directory_path = Path(directory)
         if not directory_path.exists():
             raise FileNotFoundError(f"目录不存在: {directory}")
-        
-        files_info = []
-        
+
         for ext in extensions:
             for file_path in directory_path.rglob(f"*.{ext}"):
                 # 跳过临时文件（以~$开头的文件）
                 if file_path.name.startswith('~$'):
                     continue
-                    
+
                 try:
-                    file_info = {
+                    stat = file_path.stat()
+                    yield {
                         'path': str(file_path),
                         'name': file_path.name,
                         'extension': file_path.suffix.lower(),
-                        'size': file_path.stat().st_size,
+                        'size': stat.st_size,
                         'table_name': self.get_table_name_from_filename(str(file_path)),
-                        'modified_time': file_path.stat().st_mtime
+                        'modified_time': stat.st_mtime
                     }
-                    files_info.append(file_info)
                 except Exception as e:
                     self.logger.warning(f"无法获取文件信息: {file_path}, 错误: {str(e)}")
-        
+
+    def scan_directory(self, directory: str, extensions: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """扫描目录中的数据文件"""
+        files_info = list(self.iter_directory(directory, extensions))
+
         # 按修改时间排序
         files_info.sort(key=lambda x: x['modified_time'])
-        
+
         self.logger.info(f"扫描目录 {directory}，发现 {len(files_info)} 个数据文件")
         return files_info
     
     def get_file_info(self, file_path: str) -> Dict[str, Any]:
-        """获取文件基本信息"""
-        path = Path(file_path)
-        
-        if not path.exists():
-            raise FileNotFoundError(f"文件不存在: {file_path}")
-        
+        """获取文件基本信息
+
+        按(路径, 修改时间, 大小)缓存：同一文件的重复查询只做一次stat，
+        不再重新推断表名。返回副本，调用方可安全修改。
+        """
+        try:
+            stat = Path(file_path).stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"文件不存在: {file_path}") from None
+
+        return dict(self._info_cached(
+            str(file_path), stat.st_mtime, stat.st_size, self.remove_date_suffix
+        ))
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _info_cached(path: str, mtime: float, size: int,
+                     remove_date_suffix: bool) -> Dict[str, Any]:
+        """get_file_info的缓存实现，键为(路径, 修改时间, 大小)"""
+        p = Path(path)
         return {
-            'path': str(path),
-            'name': path.name,
-            'extension': path.suffix.lower(),
-            'size': path.stat().st_size,
-            'table_name': self.get_table_name_from_filename(str(path)),
-            'modified_time': path.stat().st_mtime
+            'path': str(p),
+            'name': p.name,
+            'extension': p.suffix.lower(),
+            'size': size,
+            'table_name': FileReader._table_name_from_path(path, remove_date_suffix),
+            'modified_time': mtime
         }
     
     def preview_file(self, file_path: str, rows: int = 5, ddl_columns: Optional[List[str]] = None) -> pd.DataFrame:
-        """预览文件前几行"""
+        """预览文件前几行
+
+        只解析需要的前N行：XLSX走openpyxl只读流式迭代，CSV把nrows
+        下推给解析器；需要无表头/分隔符探测等完整逻辑时回退整读。
+        """
+        if ddl_columns is None:
+            suffix = Path(file_path).suffix.lower()
+
+            if suffix == '.xlsx':
+                preview = self._preview_xlsx(file_path, rows)
+                if preview is not None:
+                    return preview
+            elif suffix == '.csv':
+                preview = self._preview_csv(file_path, rows)
+                if preview is not None:
+                    return preview
+
         df = self.read_file(file_path, ddl_columns)
         return df.head(rows)
+
+    def _preview_xlsx(self, file_path: str, rows: int) -> Optional[pd.DataFrame]:
+        """用openpyxl只读模式取前N行，不解析整个sheet的XML流"""
+        try:
+            from itertools import islice
+
+            from openpyxl import load_workbook
+
+            workbook = load_workbook(file_path, read_only=True, data_only=True)
+            try:
+                rows_iter = workbook.active.iter_rows(values_only=True)
+                header = next(rows_iter, None)
+                if header is None:
+                    return None
+                data = list(islice(rows_iter, rows))
+            finally:
+                workbook.close()
+
+            df = pd.DataFrame(data, columns=list(header))
+            return self._clean_dataframe(df)
+        except Exception:
+            return None
+
+    def _preview_csv(self, file_path: str, rows: int) -> Optional[pd.DataFrame]:
+        """nrows下推到CSV解析器，只读取文件开头的N行"""
+        try:
+            encoding = self._detect_encoding(file_path)
+            df = pd.read_csv(
+                file_path,
+                encoding=encoding,
+                nrows=rows,
+                na_values=['', 'NaN', 'NULL', 'null', 'None']
+            )
+            if not self.header_detector.detect_header(df.columns.tolist()):
+                return None
+            return self._clean_dataframe(df)
+        except Exception:
+            return None
     
     def get_file_stats(self, file_path: str, ddl_columns: Optional[List[str]] = None) -> Dict[str, Any]:
         """获取文件统计信息"""
@@ -1,6 +1,11 @@
 """数据库连接模块"""
 
-import cx_Oracle
+try:
+    import cx_Oracle
+except ImportError:
+    # 回退python-oracledb thin模式：API与cx_Oracle兼容，
+    # 纯Python实现，无需安装Oracle客户端库
+    import oracledb as cx_Oracle
 from typing import Optional, Dict, Any, List, Tuple
 import logging
 from contextlib import contextmanager
@@ -156,16 +161,31 @@ class DatabaseConnection:
         try:
             # Preprocess data to ensure datetime values are properly formatted
             processed_batch = self._preprocess_batch_data(data_batch)
-            
-            self.cursor.executemany(sql, processed_batch)
+
+            # batcherrors让服务端完成整批数组绑定后一次性返回所有行级错误，
+            # 避免单条坏行直接中断整批的往返
+            self.cursor.executemany(sql, processed_batch, batcherrors=True)
+            batch_errors = self.cursor.getbatcherrors()
+
+            if batch_errors:
+                # 保留整批原子性：记录各失败行后回滚并抛出，
+                # 由上层决定重试或重复导入处理
+                for error in batch_errors:
+                    self.logger.error(f"批量插入行级错误 (行偏移 {error.offset}): {error.message}")
+                if self.connection:
+                    self.connection.rollback()
+                raise cx_Oracle.IntegrityError(
+                    f"批量插入存在 {len(batch_errors)} 行错误: {batch_errors[0].message}"
+                )
+
             affected_rows = self.cursor.rowcount
-            
+
             if self.import_settings.get('auto_commit', True):
                 self.connection.commit()
-            
+
             self.logger.debug(f"批量插入成功，插入 {affected_rows} 行数据")
             return affected_rows
-            
+
         except cx_Oracle.Error as e:
             self.logger.error(f"批量插入失败: {sql[:50]}..., 错误: {str(e)}")
             if self.connection:
@@ -11,7 +11,7 @@ from rich.table import Table
 from rich.panel import Panel
 
 from .core.importer import OracleImporter
-from .config.config_manager import ConfigManager
+from .config.config_manager import ConfigManager, get_config_manager
 from .database.connection import DatabaseConnection
 from .data.file_reader import FileReader
 from .utils.progress_manager import ScanProgressDisplay, DatabaseTestProgress
@@ -49,6 +49,18 @@ def safe_print_error(message: str, exception=None):
             print("ERROR: An unknown error occurred")
 
 
+# 文件大小单位查找表（从大到小排列，格式化时取第一个匹配的单位）
+_SIZE_UNITS = [(1 << 30, 'GB'), (1 << 20, 'MB'), (1 << 10, 'KB')]
+
+
+def _format_file_size(size: int) -> str:
+    """格式化文件大小为人类可读字符串"""
+    for factor, unit in _SIZE_UNITS:
+        if size > factor:
+            return f"{size / factor:.1f} {unit}"
+    return f"{size:,} B"
+
+
 class PathType(click.Path):
     """自定义路径类型，确保路径存在且可访问"""
     def convert(self, value, param, ctx):
@@ -132,8 +144,14 @@ def cli(ctx, version):
 @click.option(
     '--batch-size', '-b',
     type=click.IntRange(min=1, max=10000),
-    default=1000,
-    help='批量插入大小 (默认: 1000)'
+    default=10000,
+    help='批量插入大小 (默认: 10000)'
+)
+@click.option(
+    '--workers', '-w',
+    type=click.IntRange(min=1, max=16),
+    default=1,
+    help='文件解析的并行进程数 (默认: 1，即顺序处理)'
 )
 @click.option(
     '--dry-run', '--dr',
@@ -176,6 +194,12 @@ def cli(ctx, version):
     default=False,
     help='保留文件名中的日期后缀作为表名的一部分'
 )
+@click.option(
+    '--use-db-defaults',
+    is_flag=True,
+    default=False,
+    help='数据中缺失且DDL定义了DEFAULT的审计列由数据库默认值填充'
+)
 def import_data(
     datafolder: str,
     table: List[str],
@@ -185,13 +209,15 @@ def import_data(
     log_file: Optional[str],
     encoding: str,
     batch_size: int,
+    workers: int,
     dry_run: bool,
     max_retries: int,
     timeout: int,
     verbose: int,
     quiet: bool,
     no_color: bool,
-    keep_date_suffix: bool
+    keep_date_suffix: bool,
+    use_db_defaults: bool
 ):
     """
     执行数据导入操作
@@ -226,15 +252,20 @@ def import_data(
         config_table = Table(title="配置信息", show_header=False)
         config_table.add_column("参数", style="cyan", no_wrap=True)
         config_table.add_column("值", style="magenta")
-        
-        config_table.add_row("数据文件夹", datafolder)
-        config_table.add_row("指定表名", ', '.join(table) if table else "全部文件")
-        config_table.add_row("DDL文件夹", ddl_folder or "无")
-        config_table.add_row("生成SQL", "是" if create_sql else "否")
-        config_table.add_row("批量大小", str(batch_size))
-        config_table.add_row("干运行模式", "是" if dry_run else "否")
-        config_table.add_row("编码格式", encoding)
-        
+
+        config_rows = [
+            ("数据文件夹", datafolder),
+            ("指定表名", ', '.join(table) if table else "全部文件"),
+            ("DDL文件夹", ddl_folder or "无"),
+            ("生成SQL", "是" if create_sql else "否"),
+            ("批量大小", str(batch_size)),
+            ("并行进程数", str(workers)),
+            ("干运行模式", "是" if dry_run else "否"),
+            ("编码格式", encoding),
+        ]
+        for key, value in config_rows:
+            config_table.add_row(key, value)
+
         console.print(config_table)
         console.print()
     
@@ -254,7 +285,9 @@ def import_data(
             tables=table,
             ddl_folder=ddl_folder,
             create_sql=create_sql,
-            dry_run=dry_run
+            dry_run=dry_run,
+            workers=workers,
+            use_db_defaults=use_db_defaults
         )
         
         # 显示结果
@@ -289,7 +322,7 @@ def config():
 def init_config(output: str):
     """初始化配置文件"""
     try:
-        config_manager = ConfigManager(output)
+        config_manager = get_config_manager(output)
         config_manager.save_config()
         
         console.print(f"[green]配置文件已创建: {output}[/green]")
@@ -301,12 +334,16 @@ def init_config(output: str):
         config_table.add_column("默认值", style="magenta")
         
         db_config = config_manager.get_database_config()
-        config_table.add_row("数据库主机", db_config['host'])
-        config_table.add_row("端口", str(db_config['port']))
-        config_table.add_row("服务名", db_config['service_name'])
-        config_table.add_row("用户名", db_config['username'])
-        config_table.add_row("密码", "***")
-        
+        config_rows = [
+            ("数据库主机", db_config['host']),
+            ("端口", str(db_config['port'])),
+            ("服务名", db_config['service_name']),
+            ("用户名", db_config['username']),
+            ("密码", "***"),
+        ]
+        for key, value in config_rows:
+            config_table.add_row(key, value)
+
         console.print(config_table)
         
     except Exception as e:
@@ -319,7 +356,7 @@ def init_config(output: str):
 def validate_config(config_file: str):
     """验证配置文件"""
     try:
-        config_manager = ConfigManager(config_file)
+        config_manager = get_config_manager(config_file)
         config_manager.validate()
         console.print(f"[green]配置文件 {config_file} 验证通过[/green]")
     except Exception as e:
@@ -338,7 +375,7 @@ def validate_config(config_file: str):
 def test_database(config: str):
     """测试数据库连接"""
     def test_connection():
-        config_manager = ConfigManager(config)
+        config_manager = get_config_manager(config)
         db_connection = DatabaseConnection(config_manager)
         return db_connection.test_connection()
     
@@ -371,49 +408,55 @@ def test_database(config: str):
 )
 def scan_files(folder: str, format: str):
     """扫描文件夹中的数据文件"""
-    def scan_directory():
-        file_reader = FileReader()
-        return file_reader.scan_directory(folder)
-    
-    try:
-        progress_display = ScanProgressDisplay(console)
-        files = progress_display.scan_with_progress(scan_directory)
-        
-        if not files:
-            console.print(f"[yellow]在目录 {folder} 中未找到数据文件[/yellow]")
-            return
-        
-        if format == 'table':
-            table = Table(title=f"扫描结果: {folder}")
-            table.add_column("文件名", style="cyan", max_width=30)
-            table.add_column("表名", style="magenta", max_width=25)
-            table.add_column("格式", style="green")
-            table.add_column("大小", style="yellow", justify="right")
-            
-            for file_info in files:
-                size_str = f"{file_info['size']:,} B"
-                if file_info['size'] > 1024:
-                    size_str = f"{file_info['size']/1024:.1f} KB"
-                if file_info['size'] > 1024*1024:
-                    size_str = f"{file_info['size']/(1024*1024):.1f} MB"
-                
+    file_reader = FileReader()
+
+    # 流式消费iter_directory，避免在内存中累积完整文件列表
+    if format == 'table':
+        table = Table(title=f"扫描结果: {folder}")
+        table.add_column("文件名", style="cyan", max_width=30)
+        table.add_column("表名", style="magenta", max_width=25)
+        table.add_column("格式", style="green")
+        table.add_column("大小", style="yellow", justify="right")
+
+        def scan_directory():
+            count = 0
+            for file_info in file_reader.iter_directory(folder):
                 table.add_row(
                     file_info['name'],
                     file_info['table_name'],
                     file_info['extension'].upper(),
-                    size_str
+                    _format_file_size(file_info['size'])
                 )
-            
+                count += 1
+            return count
+    else:
+        lines = []
+
+        def scan_directory():
+            count = 0
+            for file_info in file_reader.iter_directory(folder):
+                lines.append(f"  • {file_info['name']} -> {file_info['table_name']}")
+                count += 1
+            return count
+
+    try:
+        progress_display = ScanProgressDisplay(console)
+        file_count = progress_display.scan_with_progress(scan_directory)
+
+        if not file_count:
+            console.print(f"[yellow]在目录 {folder} 中未找到数据文件[/yellow]")
+            return
+
+        if format == 'table':
             console.print("\\n")
             console.print(table)
-            
         else:
-            console.print(f"\\n发现 {len(files)} 个文件:")
-            for file_info in files:
-                console.print(f"  • {file_info['name']} -> {file_info['table_name']}")
-        
-        console.print(f"\\n[green]总计: {len(files)} 个数据文件[/green]")
-            
+            console.print(f"\\n发现 {file_count} 个文件:")
+            for line in lines:
+                console.print(line)
+
+        console.print(f"\\n[green]总计: {file_count} 个数据文件[/green]")
+
     except Exception as e:
         safe_print_error("扫描文件失败", e)
         sys.exit(1)
@@ -461,7 +504,8 @@ def preview_file(file_path: str, rows: int):
         for column in df.columns:
             data_table.add_column(column, max_width=15)
         
-        for _, row in df.iterrows():
+        # itertuples产出原生元组，避免iterrows逐行构造Series
+        for row in df.itertuples(index=False, name=None):
             data_table.add_row(*[str(value)[:50] + "..." if len(str(value)) > 50 else str(value) for value in row])
         
         console.print(data_table)
@@ -497,11 +541,13 @@ def handle_exception(exc_type, exc_value, exc_traceback):
         console.print("\\n[yellow]用户中断操作[/yellow]")
         sys.exit(1)
     else:
-        import traceback
         console.print(f"\\n[red]程序异常: {exc_value}[/red]")
-        if console._color_system:  # 只在支持颜色时显示详细错误
+        if console.is_terminal:  # 只在终端环境显示详细错误
+            from rich.traceback import Traceback
             console.print("[dim]详细错误信息:[/dim]")
-            console.print(traceback.format_exception(exc_type, exc_value, exc_traceback))
+            console.print(Traceback.from_exception(
+                exc_type, exc_value, exc_traceback, show_locals=False
+            ))
         sys.exit(1)
 
 
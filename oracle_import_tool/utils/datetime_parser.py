@@ -55,7 +55,15 @@ class FlexibleDateTimeParser:
             
             # Excel 序列号格式会由 pandas 自动处理
         ]
-        
+
+        # 去除重复格式（如带/不带前导0的写法对strptime是同一个格式）
+        self.datetime_patterns = list(dict.fromkeys(self.datetime_patterns))
+
+        # 各格式的命中计数，用于动态把高频格式排到列表前面，
+        # 减少每个值的平均strptime尝试次数
+        self._pattern_hits = {pattern: 0 for pattern in self.datetime_patterns}
+        self._hits_since_resort = 0
+
         # 预编译正则表达式用于预处理
         self.regex_patterns = [
             # 匹配类似 "2025/8/27 8:22:10.422682" 的格式，补齐前导0
@@ -125,6 +133,16 @@ class FlexibleDateTimeParser:
             
         return True
     
+    def _record_pattern_hit(self, pattern: str) -> None:
+        """记录格式命中，并定期按命中次数把高频格式前移"""
+        self._pattern_hits[pattern] += 1
+        self._hits_since_resort += 1
+
+        if self._hits_since_resort >= 256:
+            self._hits_since_resort = 0
+            # 稳定排序：命中次数相同的格式保持原有相对顺序
+            self.datetime_patterns.sort(key=lambda p: -self._pattern_hits[p])
+
     def _preprocess_datetime_string(self, dt_str: str) -> str:
         """预处理日期时间字符串"""
         if not isinstance(dt_str, str):
@@ -186,7 +204,7 @@ class FlexibleDateTimeParser:
                     else:
                         self.logger.warning(f"解析的日期无效: {parsed_dt} (来自原始值: {value})")
             except Exception as e:
-                self.logger.debug(f"Pandas自动解析失败: {e} (值: {value})")
+                self.logger.debug("Pandas自动解析失败: %s (值: %s)", e, value)
                 pass
             
             # 尝试各种格式模式
@@ -195,6 +213,7 @@ class FlexibleDateTimeParser:
                     result = datetime.strptime(processed_str, pattern)
                     # Validate that the parsed date is reasonable
                     if self._is_valid_date(result):
+                        self._record_pattern_hit(pattern)
                         return result
                     else:
                         self.logger.warning(f"解析的日期无效: {result} (来自原始值: {value})")
@@ -214,7 +233,7 @@ class FlexibleDateTimeParser:
                     else:
                         self.logger.warning(f"解析的日期无效: {parsed_dt} (来自原始值: {value})")
             except Exception as e:
-                self.logger.debug(f"变体解析失败: {e} (值: {value})")
+                self.logger.debug("变体解析失败: %s (值: %s)", e, value)
                 pass
         
         self.logger.warning(f"无法解析日期时间格式: {value} (类型: {type(value)})")
@@ -239,26 +258,29 @@ class FlexibleDateTimeParser:
         if len(non_null_series) == 0:
             return series
             
-        # Sample some values to see if they look like dates
-        sample_size = min(5, len(non_null_series))
-        sample_values = non_null_series.head(sample_size)
-        
-        date_like_count = 0
-        for val in sample_values:
-            if isinstance(val, (str, int, float)) and pd.notna(val):
-                str_val = str(val)
-                # Check if it contains common date indicators
-                if any(indicator in str_val for indicator in ['/', '-', ':', '年', '月', '日']):
+        # 小规模Series（如preview场景）直接进入批量转换：
+        # 采样启发式本身的开销与解析相当，得不偿失
+        if len(series) >= 32:
+            # Sample some values to see if they look like dates
+            sample_size = min(5, len(non_null_series))
+            sample_values = non_null_series.head(sample_size)
+
+            date_like_count = 0
+            for val in sample_values:
+                if isinstance(val, (str, int, float)) and pd.notna(val):
+                    str_val = str(val)
+                    # Check if it contains common date indicators
+                    if any(indicator in str_val for indicator in ['/', '-', ':', '年', '月', '日']):
+                        date_like_count += 1
+                elif isinstance(val, (datetime, date, pd.Timestamp)):
                     date_like_count += 1
-            elif isinstance(val, (datetime, date, pd.Timestamp)):
-                date_like_count += 1
-                
-        # If less than 30% look like dates, don't try to parse as datetime
-        if date_like_count < sample_size * 0.3:
-            self.logger.debug(f"Series 不太像日期时间数据，跳过解析: {series.name}")
-            return series
+
+            # If less than 30% look like dates, don't try to parse as datetime
+            if date_like_count < sample_size * 0.3:
+                self.logger.debug("Series 不太像日期时间数据，跳过解析: %s", series.name)
+                return series
             
-        self.logger.debug(f"解析 Series '{series.name}' 中的日期时间数据，共 {len(series)} 个值")
+        self.logger.debug("解析 Series '%s' 中的日期时间数据，共 %s 个值", series.name, len(series))
         
         # 首先尝试 pandas 的批量转换
         try:
@@ -267,11 +289,11 @@ class FlexibleDateTimeParser:
             failed_mask = result.isna() & series.notna()
             
             if not failed_mask.any():
-                self.logger.debug(f"Series 批量转换成功，共 {len(result)} 个值")
+                self.logger.debug("Series 批量转换成功，共 %s 个值", len(result))
                 return result
                 
             # 对失败的值进行单独处理
-            self.logger.info(f"批量转换失败 {failed_mask.sum()} 个值，进行单独解析")
+            self.logger.info("批量转换失败 %s 个值，进行单独解析", failed_mask.sum())
             
         except Exception as e:
             self.logger.warning(f"批量日期时间转换失败: {e}，转为逐个解析")
@@ -281,16 +303,16 @@ class FlexibleDateTimeParser:
         # 对解析失败的值逐个处理
         if failed_mask.any():
             failed_indices = series[failed_mask].index
-            self.logger.debug(f"单独解析 {len(failed_indices)} 个失败的值")
+            self.logger.debug("单独解析 %s 个失败的值", len(failed_indices))
             
             for idx in failed_indices:
                 try:
                     parsed_value = self.parse_datetime(series.loc[idx])
                     if parsed_value is not None:
                         result.loc[idx] = parsed_value
-                        self.logger.debug(f"成功解析索引 {idx} 的值: {series.loc[idx]} -> {parsed_value}")
+                        self.logger.debug("成功解析索引 %s 的值: %s -> %s", idx, series.loc[idx], parsed_value)
                 except Exception as e:
-                    self.logger.warning(f"解析索引 {idx} 的值失败: {series.loc[idx]} - {e}")
+                    self.logger.warning("解析索引 %s 的值失败: %s - %s", idx, series.loc[idx], e)
         
         return result
     
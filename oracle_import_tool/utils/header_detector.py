@@ -1,9 +1,74 @@
 """表头检测工具"""
 
-import re
+from functools import lru_cache
 from typing import List, Dict, Any
 from enum import Enum
 
+# 电话号码允许出现的字符集合
+_PHONE_CHARS = frozenset("0123456789-+() \t")
+
+
+def _is_decimal(s: str) -> bool:
+    """判断是否形如 '123.45' 的小数（整数和小数部分均为数字）"""
+    integer_part, sep, fraction_part = s.partition('.')
+    return bool(sep) and integer_part.isdigit() and fraction_part.isdigit()
+
+
+def _is_cjk_short(s: str) -> bool:
+    """判断是否为1-4个中文字符（如中文姓名）"""
+    if not 1 <= len(s) <= 4:
+        return False
+    return all(0x4E00 <= ord(c) <= 0x9FFF for c in s)
+
+
+def _looks_like_iso_date(s: str) -> bool:
+    """判断是否形如 YYYY-MM-DD / YYYY/M/D 的日期（纯字符串操作，不走正则引擎）"""
+    if not 8 <= len(s) <= 10:
+        return False
+    # 年份：4位数字 + 分隔符
+    if not (s[:4].isdigit() and s[4] in '-/'):
+        return False
+    # 月份：1-2位数字 + 分隔符
+    j = 5
+    while j < len(s) and s[j].isdigit():
+        j += 1
+    if not 1 <= j - 5 <= 2 or j >= len(s) or s[j] not in '-/':
+        return False
+    # 日期：1-2位数字收尾
+    day = s[j + 1:]
+    return 1 <= len(day) <= 2 and day.isdigit()
+
+
+def _is_phone_like(s: str) -> bool:
+    """判断是否像电话号码：至少7个字符，仅含数字和常见分隔符"""
+    return (len(s) >= 7
+            and all(c in _PHONE_CHARS for c in s)
+            and any(c.isdigit() for c in s))
+
+
+def _cell_is_data_like(s: str) -> bool:
+    """单元格分类器：判断单个单元格是否像数据值而非列名
+
+    独立的纯函数，便于按需替换为编译实现（Cython/Numba）而不影响调用方。
+    """
+    # 数字（仅ASCII数字，全角数字Oracle也无法接受）
+    if s.isascii() and s.isdigit():
+        return True
+    # 小数
+    if _is_decimal(s):
+        return True
+    # 邮箱格式
+    if '@' in s and '.' in s:
+        return True
+    # 日期格式 (YYYY-MM-DD, YYYY/M/D等)
+    if _looks_like_iso_date(s):
+        return True
+    # 中文姓名 (1-4个中文字符)
+    if _is_cjk_short(s):
+        return True
+    # 电话号码格式
+    return _is_phone_like(s)
+
 
 class HeaderDetectionMode(Enum):
     """表头检测模式"""
@@ -14,7 +79,21 @@ class HeaderDetectionMode(Enum):
 
 class HeaderDetector:
     """表头检测器"""
-    
+
+    # 常见的表头关键词：整词通过frozenset做O(1)精确匹配
+    _EXACT_HEADER_KEYWORDS = frozenset({
+        'ID', 'NAME', 'CODE', 'TYPE', 'STATUS', 'DATE', 'TIME',
+        'EMAIL', 'PHONE', 'ADDRESS', 'TITLE', 'DESCRIPTION', 'VALUE',
+        'CREATED_BY', 'CREATE_TIMESTAMP', 'UPDATED_BY', 'UPDATE_TIMESTAMP',
+        '编号', '姓名', '名称', '代码', '类型', '状态', '日期', '时间',
+        '邮箱', '电话', '地址', '标题', '描述', '数值'
+    })
+
+    # 复合关键词（如审计字段）额外做子串匹配
+    _SUBSTR_HEADER_KEYWORDS = (
+        'CREATED_BY', 'CREATE_TIMESTAMP', 'UPDATED_BY', 'UPDATE_TIMESTAMP'
+    )
+
     def __init__(self, header_config: Dict[str, Any]):
         """
         初始化表头检测器
@@ -66,7 +145,9 @@ class HeaderDetector:
             if and_keywords:
                 groups.append({
                     'type': 'and',
-                    'keywords': and_keywords
+                    'keywords': and_keywords,
+                    # 匹配时使用的集合在解析期一次性构建
+                    'keywords_set': frozenset(and_keywords)
                 })
         
         # 如果只有一个组，根据原始字符串判断是AND还是OR
@@ -88,12 +169,20 @@ class HeaderDetector:
         Returns:
             True表示包含表头，False表示不包含表头
         """
+        # 空列表无需检测
+        if not columns:
+            return False
+
         # 强制模式
         if self.detection_mode == HeaderDetectionMode.FORCE_HEADER:
             return True
         elif self.detection_mode == HeaderDetectionMode.FORCE_NO_HEADER:
             return False
-        
+
+        # 自动模式下单列且形如标识符，基本可以断定是表头
+        if len(columns) == 1 and str(columns[0]).strip().isidentifier():
+            return True
+
         # 自动检测模式
         if self.keyword_groups:
             # 使用配置的关键词进行检测
@@ -112,20 +201,20 @@ class HeaderDetector:
         Returns:
             是否匹配关键词规则
         """
-        # 将列名转为大写便于比较
-        upper_columns = [col.upper() for col in columns]
-        
+        # 将列名转为大写集合，成员判断O(1)
+        upper_set = {str(col).upper() for col in columns}
+
         # 检查每个关键词组（OR关系）
         for group in self.keyword_groups:
             if group['type'] == 'and':
                 # AND关系：所有关键词都必须存在
-                if all(keyword in upper_columns for keyword in group['keywords']):
+                if group['keywords_set'] <= upper_set:
                     return True
             else:  # or
                 # OR关系：任意关键词存在即可
-                if any(keyword in upper_columns for keyword in group['keywords']):
+                if not upper_set.isdisjoint(group['keywords_set']):
                     return True
-        
+
         return False
     
     def _default_header_detection(self, columns: List[str]) -> bool:
@@ -138,72 +227,59 @@ class HeaderDetector:
         Returns:
             是否看起来像表头
         """
-        # 常见的表头关键词
-        common_header_keywords = [
-            'ID', 'NAME', 'CODE', 'TYPE', 'STATUS', 'DATE', 'TIME',
-            'EMAIL', 'PHONE', 'ADDRESS', 'TITLE', 'DESCRIPTION', 'VALUE',
-            'CREATED_BY', 'CREATE_TIMESTAMP', 'UPDATED_BY', 'UPDATE_TIMESTAMP',
-            '编号', '姓名', '名称', '代码', '类型', '状态', '日期', '时间',
-            '邮箱', '电话', '地址', '标题', '描述', '数值'
-        ]
-        
+        # 每列只做一次标准化，后续所有判断复用
+        normalized = [str(col).strip() for col in columns]
+
         # 检查列名
-        for col in columns:
-            col_str = str(col).strip().upper()
-            
-            # 如果列名包含常见的表头关键词
-            for keyword in common_header_keywords:
-                if keyword in col_str:
-                    return True
-            
+        for col_str in normalized:
+            col_upper = col_str.upper()
+
+            # 如果列名就是常见的表头关键词（O(1)精确匹配）
+            if col_upper in self._EXACT_HEADER_KEYWORDS:
+                return True
+
+            # 复合关键词做子串匹配（如XXX_CREATED_BY）
+            if any(keyword in col_upper for keyword in self._SUBSTR_HEADER_KEYWORDS):
+                return True
+
             # 如果列名看起来像字段名（包含下划线）
-            if '_' in col_str:
+            if '_' in col_upper:
                 return True
-            
+
             # 如果列名是纯英文字母且长度合理
-            if col_str.isalpha() and 2 < len(col_str) < 20:
+            if col_upper.isalpha() and 2 < len(col_upper) < 20:
                 return True
-        
+
         # 检查是否看起来像数据行
-        looks_like_data = self._looks_like_data_row(columns)
+        looks_like_data = self._looks_like_data_row(normalized)
         return not looks_like_data
     
     def _looks_like_data_row(self, columns: List[str]) -> bool:
         """
         检查是否看起来像数据行
-        
+
         Args:
-            columns: 列名列表
-            
+            columns: 列名列表（已strip的字符串）
+
         Returns:
             是否看起来像数据行
         """
+        # 超过一半的列看起来像数据即认为是数据行
+        total = len(columns)
+        threshold = total // 2 + 1
         data_patterns = 0
-        
-        for col in columns:
-            col_str = str(col).strip()
-            
-            # 数字
-            if col_str.isdigit():
-                data_patterns += 1
-            # 小数
-            elif re.match(r'^\d+\.\d+$', col_str):
-                data_patterns += 1
-            # 邮箱格式
-            elif '@' in col_str and '.' in col_str:
-                data_patterns += 1
-            # 日期格式 (YYYY-MM-DD, MM/DD/YYYY等)
-            elif re.match(r'^\d{4}[-/]\d{1,2}[-/]\d{1,2}$', col_str):
-                data_patterns += 1
-            # 中文姓名 (1-4个中文字符)
-            elif re.match(r'^[\u4e00-\u9fff]{1,4}$', col_str):
-                data_patterns += 1
-            # 电话号码格式
-            elif re.match(r'^[\d\-\+\(\)\s]{7,}$', col_str):
+
+        for i, col_str in enumerate(columns):
+            if _cell_is_data_like(col_str):
                 data_patterns += 1
-        
-        # 如果超过一半的列看起来像数据，则认为是数据行
-        return data_patterns > len(columns) / 2
+
+            # 双向剪枝：达到阈值立即判定，剩余列不足以达标也立即返回
+            if data_patterns >= threshold:
+                return True
+            if data_patterns + (total - i - 1) < threshold:
+                return False
+
+        return data_patterns >= threshold
     
     def get_detection_summary(self) -> str:
         """
@@ -225,7 +301,21 @@ class HeaderDetector:
                     descriptions.append(f"同时包含: {keywords_str}")
                 else:
                     descriptions.append(f"包含任一: {keywords_str}")
-            
+
             return f"关键词检测模式：{' OR '.join(descriptions)}"
         else:
-            return "自动检测模式：使用默认检测逻辑"
\ No newline at end of file
+            return "自动检测模式：使用默认检测逻辑"
+
+
+@lru_cache(maxsize=16)
+def get_header_detector(header_keywords: str = '',
+                        detection_mode: str = 'auto') -> HeaderDetector:
+    """按配置缓存的HeaderDetector工厂
+
+    同一批导入的文件共用相同的表头配置，关键词表达式只需解析一次。
+    HeaderDetector在__init__之后没有可变状态，实例可以安全共享。
+    """
+    return HeaderDetector({
+        'header_keywords': header_keywords,
+        'header_detection_mode': detection_mode
+    })
\ No newline at end of file
@@ -13,13 +13,42 @@ from rich.progress import (
     TransferSpeedColumn
 )
 import os
+from collections import deque
 from rich.table import Table
 from rich.panel import Panel
 import time
-from typing import Optional, Dict, List
+from typing import Any, Deque, Optional, Dict, List
 from dataclasses import dataclass, field
 import logging
 
+# 失败文件/错误详情的最大保留条数，超过后丢弃最旧的记录
+_MAX_ERROR_RECORDS = 1000
+
+# 是否Windows平台（进程内不变，只判断一次）
+# Windows控制台下不使用SpinnerColumn，避免编码问题
+_IS_WINDOWS = os.name == 'nt'
+
+# 导入进度条的默认列组合，构建一次全程复用
+_DEFAULT_COLUMNS = (
+    TextColumn("[progress.description]{task.description}"),
+    BarColumn(),
+    TaskProgressColumn(),
+    MofNCompleteColumn(),
+    TimeElapsedColumn(),
+    TimeRemainingColumn(),
+    TransferSpeedColumn(),
+)
+
+
+@dataclass
+class ErrorDetail:
+    """单条错误记录（__slots__显著降低大量错误时的内存开销）"""
+    __slots__ = ('file', 'table', 'error', 'time')
+    file: str
+    table: str
+    error: str
+    time: float
+
 
 @dataclass
 class ImportStats:
@@ -33,8 +62,13 @@ class ImportStats:
     current_file: str = ""
     current_table: str = ""
     start_time: float = field(default_factory=time.time)
-    failed_files: List[str] = field(default_factory=list)
-    error_details: List[Dict] = field(default_factory=list)
+    # 有界缓冲，内存占用与失败数量无关；总数由下面的计数器记录
+    failed_files: Deque[str] = field(
+        default_factory=lambda: deque(maxlen=_MAX_ERROR_RECORDS))
+    error_details: Deque[ErrorDetail] = field(
+        default_factory=lambda: deque(maxlen=_MAX_ERROR_RECORDS))
+    failed_file_count: int = 0
+    total_error_count: int = 0
 
 
 class ProgressBarManager:
@@ -48,24 +82,17 @@ class ProgressBarManager:
         self.file_task = None
         self.batch_task = None
         self.logger = logging.getLogger(__name__)
+
+        # 行进度合并缓冲：积累到阈值或超时才刷新到rich，减少锁和渲染开销
+        self._pending_rows = 0
+        self._last_flush = time.monotonic()
+        # 批量插入描述文本的上次刷新时间，用于限流f-string重建
+        self._last_batch_desc_time = 0.0
     
     def create_progress_display(self) -> Progress:
         """Create multi-layer progress display"""
-        # Avoid SpinnerColumn on Windows to prevent encoding issues
-        columns = []
-        if os.name != 'nt':  # Non-Windows systems
-            columns.append(SpinnerColumn())
-        
-        columns.extend([
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TaskProgressColumn(),
-            MofNCompleteColumn(),
-            TimeElapsedColumn(),
-            TimeRemainingColumn(),
-            TransferSpeedColumn(),
-        ])
-        
+        columns = _DEFAULT_COLUMNS if _IS_WINDOWS else (SpinnerColumn(), *_DEFAULT_COLUMNS)
+
         return Progress(
             *columns,
             console=self.console,
@@ -119,43 +146,69 @@ class ProgressBarManager:
         self.logger.info(f"开始处理文件: {filename} -> {table_name}, 总行数: {total_rows}")
     
     def update_row_progress(self, processed_rows: int):
-        """更新行级别进度"""
-        # 更新文件进度
-        self.progress.update(
-            self.file_task,
-            advance=processed_rows
-        )
-        
+        """更新行级别进度（合并多次小幅更新后再刷新显示）"""
         self.stats.processed_rows += processed_rows
+        self._pending_rows += processed_rows
+
+        # 与refresh_per_second=4的渲染节奏对齐：攒够1000行或0.25秒才更新任务
+        now = time.monotonic()
+        if self._pending_rows >= 1000 or now - self._last_flush > 0.25:
+            self._flush_row_progress(now)
+
+    def _flush_row_progress(self, now: Optional[float] = None):
+        """将缓冲的行进度刷新到进度条"""
+        if self._pending_rows and self.progress is not None:
+            self.progress.update(
+                self.file_task,
+                advance=self._pending_rows
+            )
+        self._pending_rows = 0
+        self._last_flush = now if now is not None else time.monotonic()
     
     def update_batch_progress(self, batch_number: int, total_batches: int, batch_size: int, success_count: int, failed_count: int):
         """更新批量插入进度"""
         progress_percent = (batch_number / total_batches) * 100
-        
-        self.progress.update(
-            self.batch_task,
-            description=f"[yellow]批量插入: 第{batch_number}/{total_batches}批 ({batch_size}行) 成功:{success_count} 失败:{failed_count}",
-            completed=progress_percent,
-            visible=True
-        )
-        
+
+        # 描述文本按渲染节奏(refresh_per_second=4)限流重建，
+        # 进度值每批都更新以保证进度条连续前进
+        now = time.monotonic()
+        if now - self._last_batch_desc_time >= 0.25 or batch_number == total_batches:
+            self._last_batch_desc_time = now
+            self.progress.update(
+                self.batch_task,
+                description=f"[yellow]批量插入: 第{batch_number}/{total_batches}批 ({batch_size}行) 成功:{success_count} 失败:{failed_count}",
+                completed=progress_percent,
+                visible=True
+            )
+        else:
+            self.progress.update(
+                self.batch_task,
+                completed=progress_percent,
+                visible=True
+            )
+
         # 更新统计
         self.stats.success_rows += success_count
         self.stats.failed_rows += failed_count
     
     def complete_file_progress(self, success: bool = True, error_msg: str = None):
         """完成文件处理"""
+        # 先把缓冲中的行进度刷出去，保证文件进度条到位
+        self._flush_row_progress()
+
         self.stats.processed_files += 1
         
         if not success:
+            self.stats.failed_file_count += 1
             self.stats.failed_files.append(self.stats.current_file)
             if error_msg:
-                self.stats.error_details.append({
-                    'file': self.stats.current_file,
-                    'table': self.stats.current_table,
-                    'error': error_msg,
-                    'time': time.time()
-                })
+                self.stats.total_error_count += 1
+                self.stats.error_details.append(ErrorDetail(
+                    file=self.stats.current_file,
+                    table=self.stats.current_table,
+                    error=error_msg,
+                    time=time.time()
+                ))
         
         # 更新主进度
         self.progress.update(
@@ -172,12 +225,13 @@ class ProgressBarManager:
     
     def add_error(self, error_msg: str, file_name: str = None, table_name: str = None):
         """添加错误信息"""
-        self.stats.error_details.append({
-            'file': file_name or self.stats.current_file,
-            'table': table_name or self.stats.current_table,
-            'error': error_msg,
-            'time': time.time()
-        })
+        self.stats.total_error_count += 1
+        self.stats.error_details.append(ErrorDetail(
+            file=file_name or self.stats.current_file,
+            table=table_name or self.stats.current_table,
+            error=error_msg,
+            time=time.time()
+        ))
     
     def finish_import_progress(self):
         """完成导入进度显示"""
@@ -193,11 +247,12 @@ class ProgressBarManager:
         
         # 计算用时
         elapsed_time = time.time() - self.stats.start_time
-        success_files = self.stats.processed_files - len(self.stats.failed_files)
-        
+        failed_file_count = self.stats.failed_file_count
+        success_files = self.stats.processed_files - failed_file_count
+
         table.add_row("Processed Files", str(self.stats.processed_files), "+")
         table.add_row("Success Files", str(success_files), "+")
-        table.add_row("Failed Files", str(len(self.stats.failed_files)), "X" if len(self.stats.failed_files) > 0 else "+")
+        table.add_row("Failed Files", str(failed_file_count), "X" if failed_file_count > 0 else "+")
         table.add_row("Total Rows", f"{self.stats.processed_rows:,}", "+")
         table.add_row("Success Rows", f"{self.stats.success_rows:,}", "+")
         table.add_row("Failed Rows", f"{self.stats.failed_rows:,}", "X" if self.stats.failed_rows > 0 else "+")
@@ -219,17 +274,20 @@ class ProgressBarManager:
         table.add_column("错误信息", style="red", max_width=50)
         
         # 只显示最近的10个错误
-        recent_errors = self.stats.error_details[-10:]
-        
+        recent_errors = list(self.stats.error_details)[-10:]
+
         for error in recent_errors:
+            err_s = error.error
+            if len(err_s) > 50:
+                err_s = err_s[:50] + "..."
             table.add_row(
-                error.get('file', 'Unknown'),
-                error.get('table', 'Unknown'),
-                str(error.get('error', ''))[:50] + "..." if len(str(error.get('error', ''))) > 50 else str(error.get('error', ''))
+                error.file or 'Unknown',
+                error.table or 'Unknown',
+                err_s
             )
         
-        if len(self.stats.error_details) > 10:
-            table.add_row("...", "...", f"还有 {len(self.stats.error_details) - 10} 个错误未显示")
+        if self.stats.total_error_count > 10:
+            table.add_row("...", "...", f"还有 {self.stats.total_error_count - 10} 个错误未显示")
         
         return table
     
@@ -254,6 +312,33 @@ class ProgressBarManager:
             for failed_file in self.stats.failed_files:
                 self.console.print(f"  • {failed_file}")
     
+    def get_summary_dict(self) -> Dict[str, Any]:
+        """获取总结数据的纯dict形式
+
+        供只需要数字的调用方（脚本、测试）使用，
+        不构建rich的Table/Panel对象。
+        """
+        elapsed_time = time.time() - self.stats.start_time
+        failed_file_count = self.stats.failed_file_count
+
+        summary = {
+            'processed_files': self.stats.processed_files,
+            'success_files': self.stats.processed_files - failed_file_count,
+            'failed_files': failed_file_count,
+            'processed_rows': self.stats.processed_rows,
+            'success_rows': self.stats.success_rows,
+            'failed_rows': self.stats.failed_rows,
+            'error_count': self.stats.total_error_count,
+            'elapsed_time': elapsed_time,
+        }
+
+        if elapsed_time > 0 and self.stats.processed_rows > 0:
+            summary['rows_per_second'] = self.stats.processed_rows / elapsed_time
+        else:
+            summary['rows_per_second'] = 0.0
+
+        return summary
+
     def get_stats(self) -> ImportStats:
         """获取当前统计信息"""
         return self.stats
@@ -267,9 +352,8 @@ class ScanProgressDisplay:
     
     def scan_with_progress(self, scan_function, *args, **kwargs):
         """Scan operation with progress display"""
-        # Avoid SpinnerColumn on Windows
         columns = []
-        if os.name != 'nt':
+        if not _IS_WINDOWS:
             columns.append(SpinnerColumn())
         columns.append(TextColumn("[progress.description]{task.description}"))
         
@@ -302,9 +386,8 @@ class DatabaseTestProgress:
             "Connection test completed"
         ]
         
-        # Avoid SpinnerColumn on Windows
         columns = []
-        if os.name != 'nt':
+        if not _IS_WINDOWS:
             columns.append(SpinnerColumn())
         columns.extend([
             TextColumn("[progress.description]{task.description}"),
@@ -328,7 +411,6 @@ class DatabaseTestProgress:
                         progress.update(task, description=f"[red]连接失败: {str(e)}")
                         raise
                 
-                time.sleep(0.5)  # 模拟处理时间
                 progress.advance(task)
             
             progress.update(task, description="[green]数据库连接正常!")
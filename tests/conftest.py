@@ -1,25 +1,41 @@
 """pytest配置文件"""
 
+import configparser
+import copy
 import pytest
 import tempfile
 import os
+from contextlib import suppress
+from functools import lru_cache
 from pathlib import Path
 
 
+@lru_cache(maxsize=32)
+def _cached_read(path, mtime, size):
+    """按(路径, 修改时间, 大小)缓存的文件读取
+
+    同一个测试文件在一个session里会被多个测试读取，
+    pandas解析只需执行一次；调用方应在结果上调用.copy()防止意外修改。
+    """
+    from oracle_import_tool.data.file_reader import FileReader
+    return FileReader().read_file(path)
+
+
+def cached_read_file(path):
+    """读取并缓存测试数据文件，返回独立副本"""
+    return _cached_read(
+        str(path), os.path.getmtime(path), os.path.getsize(path)
+    ).copy()
+
+
 @pytest.fixture
 def temp_directory():
     """创建临时目录"""
-    temp_dir = tempfile.mkdtemp()
-    yield temp_dir
-    
-    try:
-        import shutil
-        shutil.rmtree(temp_dir)
-    except:
-        pass
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield temp_dir
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def sample_csv_data():
     """样例CSV数据"""
     return """id,name,age,email
@@ -28,7 +44,8 @@ def sample_csv_data():
 3,王五,28,wangwu@example.com"""
 
 
-@pytest.fixture
+# 纯数据fixture，消费方不做修改，session级缓存即可
+@pytest.fixture(scope='session')
 def sample_dataframe():
     """样例DataFrame"""
     try:
@@ -68,10 +85,8 @@ def temp_excel_file(temp_directory, sample_dataframe):
         pytest.skip("pandas not available")
 
 
-@pytest.fixture
-def config_content():
-    """标准配置文件内容"""
-    return """
+# 标准配置文件内容：模块级常量，所有用到该INI文本的地方共享同一个str对象
+VALID_INI = """
 [database]
 host = localhost
 port = 1521
@@ -100,6 +115,12 @@ console_output = true
 """
 
 
+@pytest.fixture(scope='session')
+def config_content():
+    """标准配置文件内容"""
+    return VALID_INI
+
+
 @pytest.fixture
 def temp_config_file(temp_directory, config_content):
     """创建临时配置文件"""
@@ -109,7 +130,109 @@ def temp_config_file(temp_directory, config_content):
     return config_file
 
 
+@pytest.fixture(scope='session')
+def cli_ctx():
+    """session级共享的Click上下文，命令树只构建一次"""
+    import click
+    from oracle_import_tool.main import cli
+
+    return click.Context(cli)
+
+
+@pytest.fixture(scope='session')
+def cli_help_text(cli_ctx):
+    """CLI帮助文本快照，整个session只渲染一次"""
+    return cli_ctx.command.get_help(cli_ctx)
+
+
+# 与config_content等价的已解析配置，供from_dict直接构造使用
+_VALID_CONFIG_DICT = {
+    'database': {
+        'host': 'localhost',
+        'port': '1521',
+        'service_name': 'ORCLPDB1.localdomain',
+        'username': 'testuser',
+        'password': 'testpass',
+        'schema': 'TESTSCHEMA',
+    },
+    'import_settings': {
+        'batch_size': '1000',
+        'max_retries': '3',
+        'timeout': '30',
+        'auto_commit': 'true',
+        'create_table_if_not_exists': 'true',
+    },
+    'data_types': {
+        'string_max_length': '4000',
+        'number_precision': '38',
+        'number_scale': '2',
+        'timestamp_format': 'YYYY-MM-DD HH24:MI:SS.FF6',
+    },
+    'logging': {
+        'log_level': 'INFO',
+        'log_format': '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        'console_output': 'true',
+    },
+}
+
+
+@pytest.fixture(scope='session')
+def _base_parser():
+    """session级只构建一次的基准ConfigParser"""
+    parser = configparser.ConfigParser(interpolation=None)
+    parser.read_dict(_VALID_CONFIG_DICT)
+    return parser
+
+
 @pytest.fixture
+def mutable_config_manager(_base_parser, tmp_path):
+    """可修改的ConfigManager
+
+    deepcopy共享parser代替重新解析配置，
+    供需要调用setter的测试使用，互不影响。
+    """
+    from oracle_import_tool.config.config_manager import ConfigManager
+
+    manager = ConfigManager.__new__(ConfigManager)
+    manager.config_file = tmp_path / 'config.ini'
+    manager.config = copy.deepcopy(_base_parser)
+    return manager
+
+
+@pytest.fixture(scope='session')
+def shared_config_manager():
+    """整个session共享的只读ConfigManager
+
+    通过from_dict直接构造，完全绕过INI文本解析和磁盘IO；
+    只做读取断言的测试直接复用该实例，
+    需要修改配置的测试应自行构造新的ConfigManager。
+    """
+    from oracle_import_tool.config.config_manager import ConfigManager
+
+    return ConfigManager.from_dict(_VALID_CONFIG_DICT)
+
+
+@pytest.fixture(scope='session')
+def mock_config_manager():
+    """session级共享的ConfigManager mock
+
+    Mock(spec=...)需要introspect整个ConfigManager类，
+    整个session只构建一次；消费方仅读取数据类型配置。
+    """
+    from unittest.mock import Mock
+    from oracle_import_tool.config.config_manager import ConfigManager
+
+    config = Mock(spec=ConfigManager)
+    config.get_data_types_config.return_value = {
+        'string_max_length': 4000,
+        'number_precision': 38,
+        'number_scale': 2,
+        'timestamp_format': 'YYYY-MM-DD HH24:MI:SS.FF6'
+    }
+    return config
+
+
+@pytest.fixture(scope='session')
 def sample_ddl_content():
     """样例DDL内容"""
     return """
@@ -144,7 +267,6 @@ def cleanup_logs():
     log_dir = Path('logs')
     if log_dir.exists():
         for log_file in log_dir.glob('*.log'):
-            try:
-                log_file.unlink()
-            except:
-                pass
\ No newline at end of file
+            # suppress收窄异常范围，不会吞掉KeyboardInterrupt/SystemExit
+            with suppress(OSError):
+                log_file.unlink()
\ No newline at end of file
@@ -1,10 +1,15 @@
 #!/usr/bin/env python3
 """测试运行脚本"""
 
+import re
 import subprocess
 import sys
 from pathlib import Path
 
+# pytest总结行中的用例计数，如 "11 passed, 1 skipped in 0.05s"
+_PASSED_RE = re.compile(r'(\d+) passed')
+_FAILED_RE = re.compile(r'(\d+) failed')
+
 
 def run_test_suite():
     """运行测试套件"""
@@ -24,50 +29,44 @@ def run_test_suite():
     total_tests = 0
     passed_tests = 0
     failed_tests = 0
-    
-    for test in safe_tests:
-        print(f"\n运行测试: {test}")
-        print("-" * 30)
-        
-        try:
-            result = subprocess.run([
-                sys.executable, "-m", "pytest", 
-                test, "-v", "--tb=short"
-            ], 
-            capture_output=True, text=True, cwd=Path(__file__).parent
-            )
-            
-            if result.returncode == 0:
-                print(f"[PASS] 测试通过: {test}")
-                # 从输出中解析测试数量
-                lines = result.stdout.split('\n')
-                for line in lines:
-                    if 'passed' in line and '=' in line:
-                        try:
-                            count = int(line.split()[0])
-                            total_tests += count
-                            passed_tests += count
-                        except:
-                            total_tests += 1
-                            passed_tests += 1
-                        break
-                else:
-                    total_tests += 1
-                    passed_tests += 1
-            else:
-                print(f"[FAIL] 测试失败: {test}")
-                print("错误信息:")
-                print(result.stdout)
-                if result.stderr:
-                    print("错误输出:")
-                    print(result.stderr)
-                failed_tests += 1
-                total_tests += 1
-                
-        except Exception as e:
-            print(f"[ERROR] 运行测试时发生异常: {e}")
-            failed_tests += 1
-            total_tests += 1
+
+    # 单次pytest调用运行全部用例，避免每个用例一次解释器启动和插件收集
+    print(f"\n运行测试: {len(safe_tests)} 组用例（单次pytest调用）")
+    print("-" * 30)
+
+    try:
+        result = subprocess.run([
+            sys.executable, "-m", "pytest",
+            *safe_tests, "-v", "--tb=short"
+        ],
+        capture_output=True, text=True, cwd=Path(__file__).parent.parent
+        )
+
+        # 直接从输出中正则提取通过/失败数量
+        passed_match = _PASSED_RE.search(result.stdout)
+        failed_match = _FAILED_RE.search(result.stdout)
+        passed_count = int(passed_match.group(1)) if passed_match else 0
+        failed_count = int(failed_match.group(1)) if failed_match else 0
+
+        if result.returncode == 0:
+            print(f"[PASS] 测试通过 ({passed_count or 1} 个用例)")
+            passed_tests += passed_count or 1
+            total_tests += passed_count or 1
+        else:
+            print(f"[FAIL] 测试失败 ({failed_count or 1} 个用例)")
+            print("错误信息:")
+            print(result.stdout)
+            if result.stderr:
+                print("错误输出:")
+                print(result.stderr)
+            passed_tests += passed_count
+            failed_tests += failed_count or 1
+            total_tests += passed_count + (failed_count or 1)
+
+    except Exception as e:
+        print(f"[ERROR] 运行测试时发生异常: {e}")
+        failed_tests += 1
+        total_tests += 1
     
     # 尝试运行功能测试（跳过pandas依赖的测试）
     print(f"\n尝试运行功能测试...")
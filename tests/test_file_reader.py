@@ -1,93 +1,106 @@
-"""测试文件读取器"""
+"""测试文件读取器
+
+pandas/openpyxl及被测模块均在fixture或测试体内延迟导入，
+使pytest --collect-only阶段不必加载这些重量级依赖。
+"""
 
 import pytest
-import pandas as pd
-import tempfile
-import os
-from pathlib import Path
 
-from oracle_import_tool.data.file_reader import FileReader
+
+# 以下fixture均为session级：文件只写一次，测试对其只读
+@pytest.fixture(scope='session')
+def temp_csv_file(tmp_path_factory):
+    """创建临时CSV文件"""
+    csv_file = tmp_path_factory.mktemp('csv') / 'test_data.csv'
+    csv_file.write_text(
+        "id,name,age,email\n"
+        "1,张三,25,zhangsan@example.com\n"
+        "2,李四,30,lisi@example.com\n"
+        "3,王五,28,wangwu@example.com\n",
+        encoding='utf-8'
+    )
+    return str(csv_file)
+
+
+@pytest.fixture(scope='session')
+def temp_excel_file(tmp_path_factory):
+    """创建临时Excel文件（openpyxl序列化只执行一次）
+
+    直接用write_only工作簿逐行写入，跳过pandas的DataFrame构造和dtype推断。
+    """
+    from openpyxl import Workbook
+
+    excel_file = tmp_path_factory.mktemp('xlsx') / 'test_data.xlsx'
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet()
+    ws.append(['id', 'name', 'age', 'email'])
+    for row in [
+        (1, '张三', 25, 'zhangsan@example.com'),
+        (2, '李四', 30, 'lisi@example.com'),
+        (3, '王五', 28, 'wangwu@example.com'),
+    ]:
+        ws.append(row)
+    wb.save(excel_file)
+
+    return str(excel_file)
+
+
+@pytest.fixture(scope='session')
+def temp_directory(tmp_path_factory, temp_csv_file, temp_excel_file):
+    """创建临时目录包含测试文件
+
+    测试不会修改这些文件，用硬链接（退化为软链接）代替整文件复制。
+    """
+    import os
+
+    temp_dir = tmp_path_factory.mktemp('scan')
+    for src, name in [(temp_csv_file, 'test_table.csv'),
+                      (temp_excel_file, 'another_table.xlsx')]:
+        dst = temp_dir / name
+        try:
+            os.link(src, dst)
+        except OSError:
+            os.symlink(src, dst)
+
+    return str(temp_dir)
 
 
 class TestFileReader:
     """文件读取器测试"""
-    
-    @pytest.fixture
-    def temp_csv_file(self):
-        """创建临时CSV文件"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write("id,name,age,email\n")
-            f.write("1,张三,25,zhangsan@example.com\n")
-            f.write("2,李四,30,lisi@example.com\n")
-            f.write("3,王五,28,wangwu@example.com\n")
-            temp_file = f.name
-        
-        yield temp_file
-        
-        try:
-            os.unlink(temp_file)
-        except:
-            pass
-    
-    @pytest.fixture
-    def temp_excel_file(self):
-        """创建临时Excel文件"""
-        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as f:
-            temp_file = f.name
-        
-        # 创建测试数据
-        df = pd.DataFrame({
-            'id': [1, 2, 3],
-            'name': ['张三', '李四', '王五'],
-            'age': [25, 30, 28],
-            'email': ['zhangsan@example.com', 'lisi@example.com', 'wangwu@example.com']
-        })
-        
-        df.to_excel(temp_file, index=False)
-        
-        yield temp_file
-        
-        try:
-            os.unlink(temp_file)
-        except:
-            pass
-    
-    @pytest.fixture
-    def temp_directory(self, temp_csv_file, temp_excel_file):
-        """创建临时目录包含测试文件"""
-        temp_dir = tempfile.mkdtemp()
-        
-        # 复制文件到临时目录
-        csv_dest = os.path.join(temp_dir, 'test_table.csv')
-        excel_dest = os.path.join(temp_dir, 'another_table.xlsx')
-        
-        import shutil
-        shutil.copy2(temp_csv_file, csv_dest)
-        shutil.copy2(temp_excel_file, excel_dest)
-        
-        yield temp_dir
-        
-        try:
-            shutil.rmtree(temp_dir)
-        except:
-            pass
-    
+
     def test_read_csv_file(self, temp_csv_file):
         """测试读取CSV文件"""
-        file_reader = FileReader()
-        df = file_reader.read_file(temp_csv_file)
-        
+        from tests.conftest import cached_read_file
+
+        df = cached_read_file(temp_csv_file)
+
         assert not df.empty
         assert len(df) == 3
         assert 'ID' in df.columns
         assert 'NAME' in df.columns
         assert df.iloc[0]['NAME'] == '张三'
-        
+
+    def test_read_buffer_csv(self):
+        """测试从内存缓冲读取CSV"""
+        import io
+
+        buf = io.StringIO("id,name,age,email\n1,张三,25,zhangsan@example.com\n")
+        from oracle_import_tool.data.file_reader import FileReader
+
+        file_reader = FileReader()
+        df = file_reader.read_buffer(buf, '.csv')
+
+        assert len(df) == 1
+        assert 'ID' in df.columns
+        assert df.iloc[0]['NAME'] == '张三'
+
     def test_read_excel_file(self, temp_excel_file):
         """测试读取Excel文件"""
-        file_reader = FileReader()
-        df = file_reader.read_file(temp_excel_file)
-        
+        from tests.conftest import cached_read_file
+
+        df = cached_read_file(temp_excel_file)
+
         assert not df.empty
         assert len(df) == 3
         assert 'ID' in df.columns
@@ -95,6 +108,8 @@ class TestFileReader:
         
     def test_scan_directory(self, temp_directory):
         """测试扫描目录"""
+        from oracle_import_tool.data.file_reader import FileReader
+
         file_reader = FileReader()
         files = file_reader.scan_directory(temp_directory)
         
@@ -112,6 +127,8 @@ class TestFileReader:
         
     def test_get_file_info(self, temp_csv_file):
         """测试获取文件信息"""
+        from oracle_import_tool.data.file_reader import FileReader
+
         file_reader = FileReader()
         info = file_reader.get_file_info(temp_csv_file)
         
@@ -125,6 +142,8 @@ class TestFileReader:
         
     def test_get_file_stats(self, temp_csv_file):
         """测试获取文件统计"""
+        from oracle_import_tool.data.file_reader import FileReader
+
         file_reader = FileReader()
         stats = file_reader.get_file_stats(temp_csv_file)
         
@@ -135,36 +154,37 @@ class TestFileReader:
         
     def test_preview_file(self, temp_csv_file):
         """测试预览文件"""
+        from oracle_import_tool.data.file_reader import FileReader
+
         file_reader = FileReader()
         df = file_reader.preview_file(temp_csv_file, rows=2)
         
         assert len(df) == 2
         assert list(df.columns) == ['ID', 'NAME', 'AGE', 'EMAIL']
         
-    def test_unsupported_file_format(self):
+    def test_unsupported_file_format(self, tmp_path):
         """测试不支持的文件格式"""
-        with tempfile.NamedTemporaryFile(suffix='.txt') as f:
-            f.write(b"test content")
-            f.flush()
-            
-            file_reader = FileReader()
-            with pytest.raises(ValueError, match="不支持的文件格式"):
-                file_reader.read_file(f.name)
+        txt_file = tmp_path / 'test.txt'
+        txt_file.write_text("test content", encoding='utf-8')
+
+        from oracle_import_tool.data.file_reader import FileReader
+
+        file_reader = FileReader()
+        with pytest.raises(ValueError, match="不支持的文件格式"):
+            file_reader.read_file(str(txt_file))
                 
     def test_nonexistent_file(self):
         """测试不存在的文件"""
+        from oracle_import_tool.data.file_reader import FileReader
+
         file_reader = FileReader()
         with pytest.raises(FileNotFoundError):
             file_reader.read_file("nonexistent.csv")
             
-    def test_empty_directory(self):
+    def test_empty_directory(self, tmp_path):
         """测试空目录"""
-        temp_dir = tempfile.mkdtemp()
-        
-        try:
-            file_reader = FileReader()
-            files = file_reader.scan_directory(temp_dir)
-            assert len(files) == 0
-            
-        finally:
-            os.rmdir(temp_dir)
\ No newline at end of file
+        from oracle_import_tool.data.file_reader import FileReader
+
+        file_reader = FileReader()
+        files = file_reader.scan_directory(str(tmp_path))
+        assert len(files) == 0
\ No newline at end of file
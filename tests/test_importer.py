@@ -2,7 +2,6 @@
 
 import pytest
 import pandas as pd
-import tempfile
 import os
 from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
@@ -13,11 +12,12 @@ from oracle_import_tool.core.importer import OracleImporter
 class TestOracleImporter:
     """导入器测试"""
     
-    @pytest.fixture
-    def temp_config_file(self):
+    # 配置与数据文件在测试中只读，session级生成一次即可
+    @pytest.fixture(scope='session')
+    def temp_config_file(self, tmp_path_factory):
         """创建临时配置文件"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.ini', delete=False) as f:
-            f.write("""
+        config_file = tmp_path_factory.mktemp('importer_config') / 'test_config.ini'
+        config_file.write_text("""
 [database]
 host = localhost
 port = 1521
@@ -36,46 +36,31 @@ create_table_if_not_exists = true
 [logging]
 log_level = INFO
 console_output = false
-""")
-            temp_file = f.name
-        
-        yield temp_file
-        
-        try:
-            os.unlink(temp_file)
-        except:
-            pass
-    
-    @pytest.fixture
-    def temp_data_directory(self):
+""", encoding='utf-8')
+        return str(config_file)
+
+    @pytest.fixture(scope='session')
+    def temp_data_directory(self, tmp_path_factory):
         """创建临时数据目录"""
-        temp_dir = tempfile.mkdtemp()
-        
+        data_dir = tmp_path_factory.mktemp('importer_data')
+
         # 创建测试CSV文件
-        csv_file = os.path.join(temp_dir, 'test_table.csv')
         df = pd.DataFrame({
             'id': [1, 2, 3],
             'name': ['测试1', '测试2', '测试3'],
             'age': [25, 30, 35]
         })
-        df.to_csv(csv_file, index=False)
-        
+        df.to_csv(data_dir / 'test_table.csv', index=False)
+
         # 创建测试Excel文件
-        excel_file = os.path.join(temp_dir, 'another_table.xlsx')
         df2 = pd.DataFrame({
             'code': ['A001', 'A002', 'A003'],
             'description': ['描述1', '描述2', '描述3'],
             'price': [100.50, 200.75, 150.25]
         })
-        df2.to_excel(excel_file, index=False)
-        
-        yield temp_dir
-        
-        try:
-            import shutil
-            shutil.rmtree(temp_dir)
-        except:
-            pass
+        df2.to_excel(data_dir / 'another_table.xlsx', index=False)
+
+        return str(data_dir)
     
     @pytest.fixture
     def mock_importer(self, temp_config_file):
@@ -174,14 +159,9 @@ console_output = false
             {'path': '/path/to/file3.csv'}
         ]
         
-        # 模拟读取文件返回不同行数的DataFrame
-        mock_dfs = [
-            pd.DataFrame({'col1': range(100)}),  # 100行
-            pd.DataFrame({'col1': range(150)}),  # 150行
-            pd.DataFrame({'col1': range(200)})   # 200行
-        ]
-        
-        mock_importer.file_reader.read_file.side_effect = mock_dfs
+        # 行数估算走_estimate_file_rows（mmap/openpyxl计数），按文件mock估算值；
+        # 直接传迭代器，避免mock内部每次调用都重新包装列表
+        mock_importer._estimate_file_rows = Mock(side_effect=iter([100, 150, 200]))
         
         total_rows = mock_importer._estimate_total_rows(files_info)
         
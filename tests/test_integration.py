@@ -3,7 +3,6 @@
 import pytest
 import tempfile
 import os
-import pandas as pd
 from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
 
@@ -15,32 +14,46 @@ from click.testing import CliRunner
 class TestIntegration:
     """集成测试"""
     
-    @pytest.fixture
-    def integration_setup(self, temp_directory, temp_config_file):
+    # 所有消费方对这些文件只读，session级生成一次，
+    # 避免每个测试重复to_csv/to_excel序列化
+    @pytest.fixture(scope='session')
+    def integration_setup(self, tmp_path_factory):
         """集成测试环境设置"""
+        from tests.conftest import VALID_INI
+
+        temp_directory = str(tmp_path_factory.mktemp('integration'))
+
+        # 配置文件
+        config_file = os.path.join(temp_directory, 'test_config.ini')
+        with open(config_file, 'w', encoding='utf-8') as f:
+            f.write(VALID_INI)
+
         # 创建测试数据文件
         data_dir = os.path.join(temp_directory, 'data')
         os.makedirs(data_dir, exist_ok=True)
         
-        # CSV文件
+        # CSV文件：数据量很小，直接用csv.writer写出，
+        # 免去构造DataFrame再to_csv的序列化开销
+        import csv
+        from openpyxl import Workbook
+
         csv_file = os.path.join(data_dir, 'users.csv')
-        users_df = pd.DataFrame({
-            'id': [1, 2, 3],
-            'name': ['张三', '李四', '王五'],
-            'email': ['zhang@test.com', 'li@test.com', 'wang@test.com'],
-            'age': [25, 30, 28]
-        })
-        users_df.to_csv(csv_file, index=False, encoding='utf-8-sig')
-        
-        # Excel文件
+        with open(csv_file, 'w', encoding='utf-8-sig', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['id', 'name', 'email', 'age'])
+            writer.writerow([1, '张三', 'zhang@test.com', 25])
+            writer.writerow([2, '李四', 'li@test.com', 30])
+            writer.writerow([3, '王五', 'wang@test.com', 28])
+
+        # Excel文件：write_only模式流式追加行
         excel_file = os.path.join(data_dir, 'products.xlsx')
-        products_df = pd.DataFrame({
-            'code': ['P001', 'P002', 'P003'],
-            'name': ['产品1', '产品2', '产品3'],
-            'price': [100.50, 200.75, 150.25],
-            'category': ['类别A', '类别B', '类别A']
-        })
-        products_df.to_excel(excel_file, index=False)
+        workbook = Workbook(write_only=True)
+        worksheet = workbook.create_sheet()
+        worksheet.append(['code', 'name', 'price', 'category'])
+        worksheet.append(['P001', '产品1', 100.50, '类别A'])
+        worksheet.append(['P002', '产品2', 200.75, '类别B'])
+        worksheet.append(['P003', '产品3', 150.25, '类别A'])
+        workbook.save(excel_file)
         
         # DDL目录
         ddl_dir = os.path.join(temp_directory, 'ddl')
@@ -64,7 +77,7 @@ CREATE TABLE USERS (
         
         return {
             'temp_dir': temp_directory,
-            'config_file': temp_config_file,
+            'config_file': config_file,
             'data_dir': data_dir,
             'ddl_dir': ddl_dir,
             'csv_file': csv_file,
@@ -261,45 +274,76 @@ CREATE TABLE USERS (
         call_args = mock_importer.import_data.call_args
         assert call_args[1]['create_sql'] is True
         
+    @staticmethod
+    def _invoke_callback(command, **kwargs):
+        """直接调用Click命令回调，返回退出码
+
+        绕过CliRunner每次invoke的参数解析和环境隔离开销，
+        stdout重定向到StringIO避免污染测试输出。
+        """
+        import io
+        from contextlib import redirect_stdout
+
+        try:
+            with redirect_stdout(io.StringIO()):
+                command.callback(**kwargs)
+        except SystemExit as exc:
+            return exc.code or 0
+        return 0
+
     def test_end_to_end_workflow(self, integration_setup):
         """测试端到端工作流程"""
         setup = integration_setup
-        runner = CliRunner()
-        
+
         # 1. 扫描文件
-        scan_result = runner.invoke(cli, ['scan', setup['data_dir']])
-        assert scan_result.exit_code == 0
-        
+        assert self._invoke_callback(
+            cli.commands['scan'], folder=setup['data_dir'], format='table') == 0
+
         # 2. 预览文件
-        preview_result = runner.invoke(cli, ['preview', setup['csv_file']])
-        assert preview_result.exit_code == 0
-        
+        assert self._invoke_callback(
+            cli.commands['preview'], file_path=setup['csv_file'], rows=5) == 0
+
         # 3. 验证配置
-        validate_result = runner.invoke(cli, ['config', 'validate', setup['config_file']])
-        assert validate_result.exit_code == 0
-        
-        # 4. 干运行导入（模拟）
+        assert self._invoke_callback(
+            cli.commands['config'].commands['validate'],
+            config_file=setup['config_file']) == 0
+
+        # 4. 干运行导入（模拟）：返回值在进入patch前构造好
+        import_summary = {
+            'total_files': 2,
+            'processed_files': 2,
+            'failed_files': 0,
+            'total_rows': 6,
+            'success_rows': 6,
+            'failed_rows': 0,
+            'errors': []
+        }
         with patch('oracle_import_tool.core.importer.OracleImporter') as mock_importer_class:
             mock_importer = Mock()
-            mock_importer.import_data.return_value = {
-                'total_files': 2,
-                'processed_files': 2,
-                'failed_files': 0,
-                'total_rows': 6,
-                'success_rows': 6,
-                'failed_rows': 0,
-                'errors': []
-            }
+            mock_importer.import_data.return_value = import_summary
             mock_importer_class.return_value = mock_importer
-            
-            import_result = runner.invoke(cli, [
-                'import',
-                '--datafolder', setup['data_dir'],
-                '--config', setup['config_file'],
-                '--dry-run'
-            ])
-            
-            assert import_result.exit_code == 0
+
+            exit_code = self._invoke_callback(
+                cli.commands['import'],
+                datafolder=setup['data_dir'],
+                table=[],
+                ddl_folder=None,
+                create_sql=False,
+                config=setup['config_file'],
+                log_file=None,
+                encoding='utf-8',
+                batch_size=10000,
+                workers=1,
+                dry_run=True,
+                max_retries=3,
+                timeout=30,
+                verbose=0,
+                quiet=False,
+                no_color=False,
+                keep_date_suffix=False,
+                use_db_defaults=False
+            )
+            assert exit_code == 0
     
     def test_error_handling_missing_data_folder(self, temp_config_file):
         """测试错误处理：缺失数据文件夹"""